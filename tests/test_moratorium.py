@@ -1,3 +1,4 @@
+from datetime import date, timedelta
 import time
 import unittest
 
@@ -14,18 +15,26 @@ class TestMoratorium(unittest.TestCase):
 
     def test_make_month_julian(self):
         mcal = moratorium.make_month_julian(2000, 1)
-        self.assertTrue(mcal == range(1, 32))
+        self.assertTrue(mcal == tuple(range(1, 32)))
 
     def test_get_nth_day(self):
         # Thanksgiving 2018 (4th Thurs of Nov):  Nov 22 (Julian day: 326)
         jday = moratorium.get_nth_day("Thursday", 4, 2018, 11)
         self.assertTrue(jday == 326)
+        # Thursdays in Nov 2018: 1, 8, 15, 22, 29 (Julian days 305 ... 333)
+        self.assertTrue(moratorium.get_nth_day("Thursday", -1, 2018, 11) == 333)
+        self.assertTrue(moratorium.get_nth_day("Thursday", -2, 2018, 11) == 326)
+        self.assertTrue(moratorium.get_nth_day("Thursday", -5, 2018, 11) == 305)
+        for n in (0, 6, -6):
+            with self.assertRaises(ValueError):
+                moratorium.get_nth_day("Thursday", n, 2018, 11)
 
     def test_is_holiday(self):
-        total_holidays = len(moratorium.holidays)
+        total_holidays = len(moratorium.get_holidays(2018))
         found = 0
+        base = date(2018, 1, 1)
         for j in range(1, 366):
-            dt = time.strptime("{} {}".format(2018, j), "%Y %j")
+            dt = (base + timedelta(days=j-1)).timetuple()
             if moratorium.is_holiday(dt):
                 found += 1
         self.assertTrue(found == total_holidays)
@@ -40,8 +49,9 @@ class TestMoratorium(unittest.TestCase):
 
     def test_is_eoy(self):
         # Thanksgiving 2018 (4th Thurs of Nov):  Nov 22 (Julian day: 326)
+        base = date(2018, 1, 1)
         for j in range(1, 366):
-            dt = time.strptime("{} {}".format(2018, j), "%Y %j")
+            dt = (base + timedelta(days=j-1)).timetuple()
             if j < 326:
                 self.assertFalse(moratorium.is_eoy(dt))
             else:
@@ -44,6 +44,12 @@ class TestPrompt(unittest.TestCase):
         result = prompt.pick_one(['a', 'b', 'c'])
         self.assertTrue(result == "a")
 
+    def test_pick_one_invalid(self):
+        replies = iter(["\u00b2", "4", "2"])
+        prompt.raw_input = lambda x: next(replies)
+        result = prompt.pick_one(['a', 'b', 'c'])
+        self.assertTrue(result == "b")
+
     def test_pick_many_all(self):
         prompt.raw_input = lambda x: "all"
         result = prompt.pick_many(['a', 'b', 'c'])
@@ -64,6 +70,12 @@ class TestPrompt(unittest.TestCase):
         result = prompt.pick_many(['a', 'b', 'c'])
         self.assertTrue(result == ['a'])
 
+    def test_pick_many_invalid(self):
+        replies = iter(["1 \u00b2", "3"])
+        prompt.raw_input = lambda x: next(replies)
+        result = prompt.pick_many(['a', 'b', 'c'])
+        self.assertTrue(result == ['c'])
+
 
 if __name__ == '__main__':
     unittest.main(exit=False)
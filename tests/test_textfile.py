@@ -1,3 +1,5 @@
+from datetime import date
+import os
 from tempfile import NamedTemporaryFile as Tmp
 import unittest
 
@@ -17,6 +19,12 @@ dict_of_dicts = {
 class TestTextFile(unittest.TestCase):
     """Test TextFile class"""
 
+    def cleanup_jsoncache(self, fname):
+        """Remove the JSON sidecar of a YAML file when the test finishes."""
+        cache = fname + tf.JSON_CACHE_EXT
+        self.addCleanup(lambda: os.path.isfile(cache) and os.remove(cache))
+        return cache
+
     def test_csv(self):
         """Test write+read CSV file."""
         tmpfile = Tmp(suffix=".csv")
@@ -28,6 +36,17 @@ class TestTextFile(unittest.TestCase):
         result = infile.read()
         self.assertTrue(result)
 
+    def test_csv_ragged(self):
+        """Test CSV blank lines are skipped and short/long rows match csv.DictReader."""
+        tmpfile = Tmp(suffix=".csv")
+        fname = tmpfile.name
+        tf.TextFile.write_text(fname, "a,b\n1,2\n\n3\n4,5,6\n\n")
+        result = tf.TextFile.read_csv(fname)
+        self.assertEqual(result, [
+            {'a': '1', 'b': '2'},
+            {'a': '3', 'b': None},
+            {'a': '4', 'b': '5', None: ['6']}])
+
     def test_ini(self):
         """Test write+read INI file."""
         tmpfile = Tmp(suffix=".ini")
@@ -38,6 +57,17 @@ class TestTextFile(unittest.TestCase):
         infile = tf.TextFile(fname)
         result = infile.read()
         self.assertTrue(result)
+        self.assertEqual(result, dict_of_dicts)
+
+    def test_ini_values(self):
+        """Test INI values are converted to numbers only when they are numbers."""
+        tmpfile = Tmp(suffix=".ini")
+        fname = tmpfile.name
+        tf.TextFile.write_text(
+            fname, "[s]\nneg = -5\nplus = +7\nfl = -1.5\ndd = --5\nnan = NaN\ninf = inf\nbig = Infinity\n")
+        result = tf.TextFile.read_ini(fname)
+        self.assertEqual(result, {'s': {
+            'neg': -5, 'plus': 7, 'fl': -1.5, 'dd': '--5', 'nan': 'NaN', 'inf': 'inf', 'big': 'Infinity'}})
 
     def test_json(self):
         """Test write+read JSON file."""
@@ -50,6 +80,27 @@ class TestTextFile(unittest.TestCase):
         result = infile.read()
         self.assertTrue(result)
 
+    def test_json_nonstandard(self):
+        """Test JSON values that only the stdlib json module supports survive a round trip."""
+        tmpfile = Tmp(suffix=".json")
+        fname = tmpfile.name
+        fdata = {'big': 2**70, 'nan': float('nan'), 'inf': float('inf'), 'ninf': float('-inf')}
+        tf.TextFile.write_json(fname, fdata)
+        result = tf.TextFile.read_json(fname)
+        self.assertEqual(result['big'], 2**70)
+        self.assertNotEqual(result['nan'], result['nan'])
+        self.assertEqual(result['inf'], float('inf'))
+        self.assertEqual(result['ninf'], float('-inf'))
+        tf.TextFile.write_json(fname, {'big': 2**70})
+        self.assertEqual(tf.TextFile.read_json(fname), {'big': 2**70})
+
+    def test_json_unsupported(self):
+        """Test JSON values the stdlib json module rejects are rejected regardless of encoder."""
+        tmpfile = Tmp(suffix=".json")
+        fname = tmpfile.name
+        with self.assertRaises(TypeError):
+            tf.TextFile.write_json(fname, {'when': date(2018, 11, 22)})
+
     def test_txt(self):
         """Test write+read TXT file."""
         tmpfile = Tmp(suffix=".txt")
@@ -61,10 +112,18 @@ class TestTextFile(unittest.TestCase):
         result = infile.read()
         self.assertTrue(result)
 
+    def test_txt_unicode(self):
+        """Test write+read of non-ASCII text."""
+        tmpfile = Tmp(suffix=".txt")
+        fname = tmpfile.name
+        tf.write(fname, "caf\u00e9 \u2603", force=True)
+        self.assertEqual(tf.read(fname), "caf\u00e9 \u2603")
+
     def test_yaml(self):
         """Test write+read YAML file."""
         tmpfile = Tmp(suffix=".yaml")
         fname = tmpfile.name
+        self.cleanup_jsoncache(fname)
         outfile = tf.TextFile(fname)
         result = outfile.write(dict_of_dicts, force=True)
         self.assertTrue(result)
@@ -72,6 +131,61 @@ class TestTextFile(unittest.TestCase):
         result = infile.read()
         self.assertTrue(result)
 
+    def test_yaml_jsoncache(self):
+        """Test YAML reads are served from (and invalidated with) the JSON sidecar."""
+        tmpfile = Tmp(suffix=".yaml")
+        fname = tmpfile.name
+        cache = self.cleanup_jsoncache(fname)
+        tf.write(fname, dict_of_dicts, force=True)
+        self.assertEqual(tf.read(fname), dict_of_dicts)
+        self.assertTrue(os.path.isfile(cache))
+        self.assertEqual(tf.read(fname), dict_of_dicts)
+        tf.write(fname, list_of_dicts, force=True)
+        self.assertFalse(os.path.isfile(cache))
+        self.assertEqual(tf.read(fname), list_of_dicts)
+
+    def test_yaml_jsoncache_older_mtime(self):
+        """Test a YAML file replaced with an older mtime (e.g. cp -p) is not served from the sidecar."""
+        tmpfile = Tmp(suffix=".yaml")
+        fname = tmpfile.name
+        cache = self.cleanup_jsoncache(fname)
+        tf.TextFile.write_yaml(fname, {'a': 1})
+        self.assertEqual(tf.TextFile.read_yaml(fname), {'a': 1})
+        self.assertTrue(os.path.isfile(cache))
+        tf.TextFile.write_text(fname, "a: 2\n")
+        os.utime(fname, ns=(1, 1))
+        self.assertEqual(tf.TextFile.read_yaml(fname), {'a': 2})
+
+    def test_read_cache(self):
+        """Test repeat reads are cached until the file changes."""
+        tmpfile = Tmp(suffix=".json")
+        fname = tmpfile.name
+        tf.write(fname, dict_of_dicts, force=True)
+        first = tf.read(fname)
+        self.assertIs(tf.read(fname), first)
+        tf.write(fname, list_of_dicts, force=True)
+        self.assertEqual(tf.read(fname), list_of_dicts)
+
+    def test_read_many(self):
+        """Test reading several files at once."""
+        tmpfiles = [Tmp(suffix=".json"), Tmp(suffix=".json")]
+        fnames = [tmpfile.name for tmpfile in tmpfiles]
+        tf.write(fnames[0], dict_of_dicts, force=True)
+        tf.write(fnames[1], list_of_dicts, force=True)
+        result = tf.read_many(fnames, workers=2)
+        self.assertEqual(result, [dict_of_dicts, list_of_dicts])
+        self.assertEqual(tf.read_many([]), [])
+        self.assertEqual(tf.read_many(fnames[:1]), [dict_of_dicts])
+
+    def test_read_many_ftype(self):
+        """Test reading several files at once with an overridden file type."""
+        tmpfiles = [Tmp(suffix=".dat"), Tmp(suffix=".dat")]
+        fnames = [tmpfile.name for tmpfile in tmpfiles]
+        tf.write(fnames[0], dict_of_dicts, ftype='json', force=True)
+        tf.write(fnames[1], list_of_dicts, ftype='json', force=True)
+        result = tf.read_many(fnames, ftype='json')
+        self.assertEqual(result, [dict_of_dicts, list_of_dicts])
+
     def test_confirm_yn_n(self):
         """Test confirmation prompt."""
         for reply in ['Y', 'y']:
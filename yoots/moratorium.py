@@ -1,7 +1,18 @@
 """Functions for determining when a regularly-scheduled moratorium is in effect."""
+import calendar
+from datetime import date
+from functools import lru_cache
 import time
 
-this_year = int(time.strftime("%Y"))
+DAY_IDX = {
+    "Monday": 0,
+    "Tuesday": 1,
+    "Wednesday": 2,
+    "Thursday": 3,
+    "Friday": 4,
+    "Saturday": 5,
+    "Sunday": 6,
+}
 
 
 def make_day_julian(isodate):
@@ -12,10 +23,10 @@ def make_day_julian(isodate):
     Returns:
         (int): Julian date
     """
-    dt = time.strptime(isodate, "%Y-%m-%d")
-    return int(time.strftime("%j", dt))
+    return date.fromisoformat(isodate).timetuple().tm_yday
 
 
+@lru_cache(maxsize=128)
 def make_month_julian(year, month):
     """Generate a list of Julian date integers within a given month.
 
@@ -23,57 +34,94 @@ def make_month_julian(year, month):
         year (int): 4-digit year
         month (int): integer month (1 = Jan, 2 = Feb, etc.)
     Returns:
-        jdays (list): list of Julian dates
+        jdays (tuple): tuple of Julian dates (cached, so immutable)
     """
-    jdays = []
-    for d in range(1, 32):
-        try:
-            dtuple = time.strptime("{} {} {}".format(year, month, d), "%Y %m %d")
-            jday = int(time.strftime("%j", dtuple))
-            jdays.append(jday)
-        except ValueError:
-            pass
-    return jdays
+    _, ndays = calendar.monthrange(year, month)
+    base = date(year, 1, 1).toordinal() - 1
+    return tuple(date(year, month, d).toordinal() - base for d in range(1, ndays + 1))
 
 
 def get_nth_day(day_name, n, year, month):
-    """Get Nth occurence of day named <blah> in some month.  If n = -1, return the last one.
+    """Get Nth occurence of day named <blah> in some month.  Negative n counts back from the
+    last one (-1 = last, -2 = second-to-last, etc.).
 
     Args:
         day_name (str): name of day, full and capitalized, e.g. "Thursday"
-        n (int): Nth occurrence of day_name (1 = first, -1 = last)
+        n (int): Nth occurrence of day_name (1 = first, -1 = last); must not be 0
         year (int): 4-digit year
         month (int): integer month (1 = Jan, 2 = Feb, etc.)
     Returns:
         jday (int): Julian date
+    Raises:
+        ValueError: if n is 0, or there is no Nth occurrence of day_name in the month
     """
-    days_matched = []
-    for d in range(1, 32):
-        try:
-            dt = time.strptime("{} {} {}".format(year, month, d), "%Y %m %d")
-            dname = time.strftime("%A", dt)
-            if dname == day_name:
-                j = int(time.strftime("%j", dt))
-                days_matched.append(j)
-        except ValueError:
-            pass
-    if n == -1:
-        return days_matched[-1]
+    wd = DAY_IDX[day_name]
+    first_wd, ndays = calendar.monthrange(year, month)
+    first = 1 + (wd - first_wd) % 7
+    last = first + 7 * ((ndays - first) // 7)
+    if n > 0:
+        d = first + 7 * (n - 1)
+    elif n < 0:
+        d = last - 7 * (-n - 1)
     else:
-        return days_matched[n-1]
-
-
-holidays = {
-    "New Year's Day": make_day_julian("{}-01-01".format(this_year)),
-    "Martin Luther King Jr Day": get_nth_day("Monday", 3, this_year, 1),
-    "Presidents Day": get_nth_day("Monday", 3, this_year, 2),
-    "Memorial Day": get_nth_day("Monday", -1, this_year, 5),
-    "Independence Day": make_day_julian("{}-07-04".format(this_year)),
-    "Labor Day": get_nth_day("Monday", 1, this_year, 9),
-    "Thanksgiving": get_nth_day("Thursday", 4, this_year, 11),
-    "Thanksgiving Friday": get_nth_day("Thursday", 4, this_year, 11)+1,
-    "Christmas": make_day_julian("{}-12-25".format(this_year))
-}
+        d = 0
+    if not first <= d <= last:
+        raise ValueError("No occurrence {} of {} in {}-{:02d}".format(n, day_name, year, month))
+    return date(year, month, d).timetuple().tm_yday
+
+
+@lru_cache(maxsize=4)
+def get_holidays(year):
+    """Get company holidays for a given year.  Results are cached per year, so
+    callers should treat the returned dictionary as read-only.
+
+    Args:
+        year (int): 4-digit year
+    Returns:
+        holidays (dict): holiday names mapped to Julian dates
+    """
+    return {
+        "New Year's Day": make_day_julian("{}-01-01".format(year)),
+        "Martin Luther King Jr Day": get_nth_day("Monday", 3, year, 1),
+        "Presidents Day": get_nth_day("Monday", 3, year, 2),
+        "Memorial Day": get_nth_day("Monday", -1, year, 5),
+        "Independence Day": make_day_julian("{}-07-04".format(year)),
+        "Labor Day": get_nth_day("Monday", 1, year, 9),
+        "Thanksgiving": get_nth_day("Thursday", 4, year, 11),
+        "Thanksgiving Friday": get_nth_day("Thursday", 4, year, 11)+1,
+        "Christmas": make_day_julian("{}-12-25".format(year))
+    }
+
+
+@lru_cache(maxsize=4)
+def _holiday_bitmap(year):
+    """Build a holiday lookup table for a given year, indexed by Julian date.
+
+    Args:
+        year (int): 4-digit year
+    Returns:
+        bitmap (bytes): bitmap[jday] == 1 if jday is a holiday, else 0
+    """
+    bitmap = bytearray(367)
+    for jday in get_holidays(year).values():
+        bitmap[jday] = 1
+    return bytes(bitmap)
+
+
+def __getattr__(name):
+    """Resolve the legacy module attributes `this_year` and `holidays` (the current year's
+    holiday table) at access time, so they stay correct across a year rollover.
+
+    Args:
+        name (str): attribute name
+    Returns:
+        (int|dict): current year, or holidays for the current year
+    """
+    if name == "this_year":
+        return int(time.strftime("%Y"))
+    if name == "holidays":
+        return get_holidays(int(time.strftime("%Y")))
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
 
 
 def is_holiday(dtuple=None):
@@ -86,11 +134,7 @@ def is_holiday(dtuple=None):
     """
     if dtuple is None:
         dtuple = time.gmtime()
-    today = int(time.strftime("%j", dtuple))
-    if today in holidays.values():
-        return True
-    else:
-        return False
+    return bool(_holiday_bitmap(dtuple.tm_year)[dtuple.tm_yday])
 
 
 def is_eom(dtuple=None, end_days=3):
@@ -104,7 +148,7 @@ def is_eom(dtuple=None, end_days=3):
     """
     if dtuple is None:
         dtuple = time.gmtime()
-    today_julian = int(time.strftime("%j", dtuple))
+    today_julian = dtuple.tm_yday
     year = dtuple.tm_year
     month = dtuple.tm_mon
     jcal = make_month_julian(year, month)
@@ -124,8 +168,8 @@ def is_eoy(dtuple=None):
     """
     if dtuple is None:
         dtuple = time.gmtime()
-    thx = holidays["Thanksgiving"]
-    today = int(time.strftime("%j", dtuple))
+    thx = get_holidays(dtuple.tm_year)["Thanksgiving"]
+    today = dtuple.tm_yday
     if today >= thx:
         return True
     else:
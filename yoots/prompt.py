@@ -1,5 +1,4 @@
 """Functions for prompting users for input."""
-from collections import OrderedDict
 from getpass import getpass
 import random
 import time
@@ -21,7 +20,7 @@ def confirm_yn(msg="Shall we do this thing? (y/n): "):
     confirmed = False
     while not reply_valid:
         reply = raw_input(msg).strip()[0].lower()
-        if reply in valid_replies.keys():
+        if reply in valid_replies:
             reply_valid = True
             confirmed = valid_replies[reply]
         else:
@@ -38,14 +37,12 @@ def confirm_countdown(msg="Will continue in [{}] seconds; press Ctrl-C to abort.
     Returns:
         (bool) True=user didn't press Ctrl-C,  False=user pressed Ctrl-C
     """
-    time_at_timeout = time.time() + timeout
-    while time.time() < time_at_timeout:
-        try:
-            eprint(msg.format(timeout), newline='\r')
-            timeout -= 1
+    try:
+        for remaining in range(timeout, 0, -1):
+            eprint(msg.format(remaining), newline='\r')
             time.sleep(1)
-        except KeyboardInterrupt:
-            return False
+    except KeyboardInterrupt:
+        return False
     return True
 
 
@@ -62,7 +59,7 @@ def confirm_rnd(min_=100, max_=1000):
     response = None
     msg = "Enter this number [ {} ] to confirm, or press Ctrl-C to cancel: "
     while not confirmed:
-        rnd_int = random.choice(range(min_, max_))
+        rnd_int = random.randrange(min_, max_)
         try:
             response = raw_input(msg.format(rnd_int)).strip()
             response = int(response)
@@ -139,16 +136,15 @@ def pick_one(item_list=None, msg="Multiple options found, choose one."):
     """
     assert iter(item_list),\
         "ERROR: This function only accepts an iterable."
+    items = list(item_list)
     chosen = None
-    options = OrderedDict()
-    for x, y in enumerate(item_list):
-        options[str(x+1)] = y
     while not chosen:
         eprint("\n" + msg + "\n")
-        for item_num, item in options.items():
+        for item_num, item in enumerate(items, 1):
             eprint("{}. {}".format(item_num, item))
         user_num = raw_input("\nEnter the item number you want: ").strip()
-        chosen = options.get(user_num)
+        idx = int(user_num) - 1 if user_num.isdecimal() else -1
+        chosen = items[idx] if 0 <= idx < len(items) else None
         if not chosen:
             eprint("\n\tERROR: That is not a valid selection!\n")
     return chosen
@@ -166,13 +162,10 @@ def pick_many(item_list=None, msg="Multiple options exist, choose all that apply
     assert isinstance(item_list, list),\
         "ERROR: This function only accepts a list."
     chosen = []
-    options = OrderedDict()
-    for x, y in enumerate(item_list):
-        options[str(x+1)] = y
     while not chosen:
         selection = []
         eprint("\n" + msg + "\n")
-        for item_num, item in options.items():
+        for item_num, item in enumerate(item_list, 1):
             eprint("{}. {}".format(item_num, item))
         user_choice = raw_input(
             "\nEnter the item number(s) you want, separated by SPACE.  Or enter 'all' or 'none': ").lower()
@@ -183,12 +176,12 @@ def pick_many(item_list=None, msg="Multiple options exist, choose all that apply
         else:
             selections = user_choice.split(' ')
             for selection in selections:
-                item = options.get(selection)
-                if item is None:
+                idx = int(selection) - 1 if selection.isdecimal() else -1
+                if 0 <= idx < len(item_list):
+                    chosen.append(item_list[idx])
+                else:
                     chosen = []
                     break
-                else:
-                    chosen.append(item)
         if not chosen:
             eprint("\n\tERROR: There is no [ {} ] on this list! You typed: '{}'".format(selection, user_choice))
     return chosen
@@ -2,13 +2,49 @@
 import ast
 import configparser
 import csv
+from functools import lru_cache
 import json
+import math
+from multiprocessing import Pool
 import os
 
 import yaml
+try:
+    from yaml import CSafeLoader as _YLoader, CSafeDumper as _YDumper
+except ImportError:
+    from yaml import SafeLoader as _YLoader, SafeDumper as _YDumper
+try:
+    import orjson as _fastjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
 
 from yoots import eprint
 
+# YAML files are cached as JSON in a sidecar file named <fname><JSON_CACHE_EXT>
+JSON_CACHE_EXT = '.jsoncache'
+
+
+def _has_nonfinite(fdata):
+    """Check whether data contains a NaN or infinite float anywhere.
+
+    Args:
+        fdata (*): data to check, type varies
+    Returns:
+        (bool): True if a non-finite float was found
+    """
+    stack = [fdata]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, float):
+            if not math.isfinite(obj):
+                return True
+        elif isinstance(obj, dict):
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+    return False
+
 
 class TextFile(object):
     """Object interface to a text-based file."""
@@ -23,30 +59,22 @@ class TextFile(object):
         """
         self.fname = fname
         if ftype is None:
-            self.ftype = os.path.splitext(fname)[-1].strip('.').lower()
+            ftype = os.path.splitext(fname)[-1].strip('.').lower()
+        self.ftype = ftype
         assert self.ftype in ('csv', 'ini', 'json', 'txt', '', 'yaml'),\
             "Unsupported file type: {}".format(self.ftype)
 
     def read(self):
-        """Read contents of file.
+        """Read contents of file.  Parsed data is cached until the file's mtime or size
+        changes, so repeat reads return the same (shared) object; copy it before mutating.
 
         Returns:
             fdata (*): file data, type varies by file content
+        Raises:
+            FileNotFoundError: if the file does not exist
         """
-        assert os.path.isfile(self.fname), "File not found: {}".format(self.fname)
-        if self.ftype == 'csv':
-            fdata = self.read_csv(self.fname)
-        elif self.ftype == 'ini':
-            fdata = self.read_ini(self.fname)
-        elif self.ftype == 'json':
-            fdata = self.read_json(self.fname)
-        elif self.ftype in ('txt', ''):
-            fdata = self.read_text(self.fname)
-        elif self.ftype == 'yaml':
-            fdata = self.read_yaml(self.fname)
-        else:
-            fdata = None
-        return fdata
+        st = os.stat(self.fname)  # raises FileNotFoundError (with fname) if missing
+        return _parse_cached(self.fname, st.st_mtime_ns, st.st_size, self.ftype)
 
     @staticmethod
     def read_csv(fname):
@@ -57,17 +85,34 @@ class TextFile(object):
         Returns:
             fdata (list): data content of CSV file, list of dictionaries
         """
-        with open(fname) as infile:
-            reader = csv.DictReader(infile)
-            fdata = [row for row in reader]
+        with open(fname, newline='') as infile:
+            reader = csv.reader(infile)
+            header = next(reader, [])
+            nfields = len(header)
+            fdata = []
+            for row in reader:
+                # match csv.DictReader: skip blank lines, pad short rows with None,
+                # and collect extra fields of long rows under the None key
+                if not row:
+                    continue
+                rec = dict(zip(header, row))
+                if len(row) < nfields:
+                    for key in header[len(row):]:
+                        rec[key] = None
+                elif len(row) > nfields:
+                    rec[None] = row[nfields:]
+                fdata.append(rec)
         return fdata
 
     @staticmethod
-    def read_ini(fname):
+    def read_ini(fname, literal=False):
         """Read contents of INI file, using Python built-in ConfigParser module.
 
         Args:
             fname (str): filename (may include a directory path)
+            literal (bool): interpret values as Python literals (lists, dicts, bools, etc.)
+                using ast.literal_eval; by default only ints and finite floats are converted.
+                Only available when calling read_ini directly; read() uses the default.
         Returns:
             fdata (dict): data content of file (nested dictionary)
         """
@@ -79,21 +124,51 @@ class TextFile(object):
             fdata[section] = dict(ini.items(section))
             # configparser reads values as strings, so try to interpret
             for key, value in fdata[section].items():
-                try:
-                    fdata[section][key] = ast.literal_eval(value)
-                except (SyntaxError, ValueError):
-                    pass
+                if literal:
+                    try:
+                        fdata[section][key] = ast.literal_eval(value)
+                    except (SyntaxError, ValueError):
+                        pass
+                else:
+                    fdata[section][key] = TextFile._ini_number(value)
         return fdata
 
+    @staticmethod
+    def _ini_number(value):
+        """Convert an INI value to int or (finite) float if it looks like one.
+
+        Args:
+            value (str): INI value
+        Returns:
+            (int|float|str): converted value, or the original string
+        """
+        try:
+            return int(value)
+        except ValueError:
+            pass
+        try:
+            number = float(value)
+        except ValueError:
+            return value
+        return number if math.isfinite(number) else value
+
     @staticmethod
     def read_json(fname):
-        """Read contents of JSON file, using Python built-in json module.
+        """Read contents of JSON file, using orjson if available, else Python built-in json module.
 
         Args:
             fname (str): filename (may include a directory path)
         Returns:
             fdata (*): data content of file, type varies by file contents
         """
+        if _HAS_ORJSON:
+            with open(fname, 'rb') as infile:
+                indata = infile.read()
+            try:
+                return _fastjson.loads(indata)
+            except _fastjson.JSONDecodeError:
+                # json accepts more than orjson (e.g. ints > 64 bits, NaN, Infinity)
+                return json.loads(indata.decode('utf-8'))
         with open(fname) as infile:
             fdata = json.load(infile)
         return fdata
@@ -105,23 +180,45 @@ class TextFile(object):
         Args:
             fname (str): filename (may include a directory path)
         Returns:
-            fdata (str): string content of text file
+            fdata (str): string content of text file (UTF-8, newlines normalized to '\\n')
         """
-        with open(fname) as infile:
-            fdata = infile.read()
+        # one-shot decode of the raw bytes is faster than text-mode incremental decoding
+        with open(fname, 'rb') as infile:
+            fdata = infile.read().decode('utf-8')
+        if '\r' in fdata:
+            fdata = fdata.replace('\r\n', '\n').replace('\r', '\n')
         return fdata
 
     @staticmethod
     def read_yaml(fname):
-        """Read contents of YAML file.
+        """Read contents of YAML file, using PyYAML's safe loader (LibYAML-backed if available).
+        Parsed data is also saved to a JSON sidecar file, along with the YAML file's mtime and
+        size; the sidecar is read instead of the YAML file for as long as both still match.
 
         Args:
             fname (str): filename (may include a directory path)
         Returns:
             fdata (*): data content of file, type varies by file contents
         """
+        cache = fname + JSON_CACHE_EXT
+        st = os.stat(fname)
+        try:
+            with open(cache) as infile:
+                cached = json.load(infile)
+            if cached['mtime_ns'] == st.st_mtime_ns and cached['size'] == st.st_size:
+                return cached['data']
+        except (OSError, ValueError, TypeError, KeyError):
+            pass
         with open(fname) as infile:
-            fdata = yaml.load(infile)
+            fdata = yaml.load(infile, Loader=_YLoader)
+        # only cache data that survives a JSON round trip unchanged (e.g. no dates, no int keys)
+        try:
+            cdata = json.dumps({'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'data': fdata})
+            if json.loads(cdata)['data'] == fdata:
+                with open(cache, 'w') as outfile:
+                    outfile.write(cdata)
+        except (OSError, TypeError, ValueError):
+            pass
         return fdata
 
     def write(self, fdata, force=None):
@@ -133,13 +230,18 @@ class TextFile(object):
         Returns:
             (int): bytes written to file (i.e. file size).
         """
-        if os.path.isfile(self.fname) and not force:
-            force = self.confirm_yn_n()
-            if force:
-                eprint("Overwriting file: {}".format(self.fname))
+        if not force:
+            try:
+                os.stat(self.fname)
+            except FileNotFoundError:
+                pass
             else:
-                eprint("Write cancelled: {}".format(self.fname))
-                return 0
+                force = self.confirm_yn_n()
+                if force:
+                    eprint("Overwriting file: {}".format(self.fname))
+                else:
+                    eprint("Write cancelled: {}".format(self.fname))
+                    return 0
 
         if self.ftype == 'csv':
             self.write_csv(self.fname, fdata)
@@ -154,7 +256,7 @@ class TextFile(object):
         else:
             eprint("Unknown filetype [{}]; writing as text.".format(self.ftype))
             self.write_text(self.fname, fdata)
-        return os.path.getsize(self.fname)
+        return os.stat(self.fname).st_size
 
     @staticmethod
     def confirm_yn_n(msg="File exists! Overwrite? (y/N): "):
@@ -187,7 +289,7 @@ class TextFile(object):
         assert isinstance(fdata, list), "Input data must be a list."
         assert isinstance(fdata[0], dict), "Each list element must be a dictionary."
         keys = fdata[0].keys()
-        with open(fname, 'w') as outfile:
+        with open(fname, 'w', newline='') as outfile:
             writer = csv.DictWriter(outfile, fieldnames=keys, lineterminator='\n')
             writer.writeheader()
             writer.writerows(fdata)
@@ -216,7 +318,11 @@ class TextFile(object):
 
     @staticmethod
     def write_json(fname, fdata):
-        """Write data to JSON file, using Python built-in json module.
+        """Write data to JSON file, using orjson if available, else Python built-in json module.
+        Data orjson can't write the way json would (non-str keys, ints > 64 bits, NaN/Infinity,
+        dates, dataclasses) is handed to json.  Remaining differences when orjson is used:
+        UUID and Enum values are written (json raises TypeError), and non-ASCII text is
+        written as UTF-8 rather than as \\uXXXX escapes.
 
         Args:
             fname (str): filename (may include a directory path)
@@ -224,13 +330,29 @@ class TextFile(object):
         Returns:
             fname (str): filename (may include a directory path)
         """
+        if _HAS_ORJSON:
+            try:
+                options = (_fastjson.OPT_INDENT_2 | _fastjson.OPT_PASSTHROUGH_DATETIME
+                           | _fastjson.OPT_PASSTHROUGH_DATACLASS)
+                outdata = _fastjson.dumps(fdata, option=options)
+            except TypeError:
+                # orjson is stricter than json (e.g. non-str keys, ints > 64 bits), and
+                # passes dates and dataclasses through so json can reject them as usual
+                outdata = None
+            # orjson writes NaN/Infinity as null, so leave data containing them to json
+            if outdata is not None and b'null' in outdata and _has_nonfinite(fdata):
+                outdata = None
+            if outdata is not None:
+                with open(fname, 'wb') as outfile:
+                    outfile.write(outdata)
+                return fname
         with open(fname, 'w') as outfile:
             json.dump(fdata, outfile, indent=2)
         return fname
 
     @staticmethod
     def write_text(fname, fdata):
-        """Write data to text file.
+        """Write data to text file (UTF-8, to match read_text).
 
         Args:
             fname (str): filename (may include a directory path)
@@ -238,7 +360,7 @@ class TextFile(object):
         Returns:
             fname (str): filename (may include a directory path)
         """
-        with open(fname, 'w') as outfile:
+        with open(fname, 'w', encoding='utf-8') as outfile:
             outfile.write(str(fdata))
         return fname
 
@@ -252,11 +374,42 @@ class TextFile(object):
         Returns:
             fname (str): filename (may include a directory path)
         """
+        cache = fname + JSON_CACHE_EXT
+        if os.path.isfile(cache):
+            os.remove(cache)
         with open(fname, 'w') as outfile:
-            outfile.write(yaml.dump(fdata, default_flow_style=False))
+            outfile.write(yaml.dump(fdata, Dumper=_YDumper, default_flow_style=False))
         return fname
 
 
+@lru_cache(maxsize=100)
+def _parse_cached(fname, mtime_ns, size, ftype):
+    """Parse a file with the reader for its type.  mtime_ns and size are only used as
+    cache keys, so a modified file is parsed again.
+
+    Args:
+        fname (str): filename (may include a directory path)
+        mtime_ns (int): file modification time (nanoseconds)
+        size (int): file size (bytes)
+        ftype (str): file type, csv|ini|json|txt|yaml
+    Returns:
+        fdata (*): file data, type varies by file content
+    """
+    if ftype == 'csv':
+        fdata = TextFile.read_csv(fname)
+    elif ftype == 'ini':
+        fdata = TextFile.read_ini(fname)
+    elif ftype == 'json':
+        fdata = TextFile.read_json(fname)
+    elif ftype in ('txt', ''):
+        fdata = TextFile.read_text(fname)
+    elif ftype == 'yaml':
+        fdata = TextFile.read_yaml(fname)
+    else:
+        fdata = None
+    return fdata
+
+
 def read(fname, ftype=None):
     """File read function for typical use cases.
 
@@ -270,6 +423,38 @@ def read(fname, ftype=None):
     return infile.read()
 
 
+def _parse_one(fname, ftype=None):
+    """Read a file in a worker process (top-level so it can be pickled).
+
+    Args:
+        fname (str): filename (may include a directory path)
+        ftype (str): override file extension, treat file as csv|ini|json|txt|yaml
+    Returns:
+        (*): Data retrieved from file.
+    """
+    return read(fname, ftype)
+
+
+def read_many(fnames, ftype=None, workers=None):
+    """Read several files in parallel, parsing each one in a separate worker process.
+    A single file is read in this process, without starting a pool.
+
+    Args:
+        fnames (list): filenames (may include directory paths)
+        ftype (str): override file extension, treat all files as csv|ini|json|txt|yaml
+        workers (int): max number of worker processes (default: number of CPUs),
+            never more than the number of files
+    Returns:
+        (list): Data retrieved from each file, in the same order as fnames.
+    """
+    fnames = list(fnames)
+    if len(fnames) <= 1:
+        return [read(fname, ftype) for fname in fnames]
+    workers = min(workers or os.cpu_count() or 1, len(fnames))
+    with Pool(workers) as pool:
+        return pool.starmap(_parse_one, [(fname, ftype) for fname in fnames])
+
+
 def write(fname, fdata, ftype=None, force=None):
     """File write function for typical use cases.
 